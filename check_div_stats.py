@@ -0,0 +1,71 @@
+# Consistency check for the division statistics implementations
+# Runs every _div_stats variant available in this environment (pure Python,
+# and NumPy / Numba when installed) on the same hub columns and checks that
+# they agree with the pure-Python reference.
+
+import importlib.util
+import math
+import os
+
+# main-task.py is not importable by name, so load it from its path
+_spec = importlib.util.spec_from_file_location(
+    "main_task", os.path.join(os.path.dirname(os.path.abspath(__file__)), "main-task.py"))
+main_task = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(main_task)
+
+
+def build_hubs():
+    """Build sample hubs covering empty, partly filled and scored divisions."""
+    empty = main_task.TechHub()
+    
+    scored = main_task.TechHub()
+    scored.add_attachee("John Smith", "Engineering")
+    scored.add_attachee("Maria Garcia", "Engineering")
+    scored.add_attachee("Jennifer Lee", "Hub Support")
+    scored.add_attachee("Robert Chen", "Hub Support")
+    scored.assign_task_by_division("Engineering", "Complete code review")
+    scored.assign_task_by_division("Hub Support", "Update visitor registration system")
+    scored.get_attachee("John Smith").add_score("Complete code review", 7)
+    scored.get_attachee("Maria Garcia").add_score("Complete code review", 2.3)
+    scored.get_attachee("Jennifer Lee").add_score("Update visitor registration system", 0.1)
+    
+    return {"empty hub": empty, "scored hub": scored}
+
+
+def compare(reference, result, n_div):
+    """Return True if result's (sums, counts) match the reference's."""
+    ref_sums, ref_counts = reference
+    sums, counts = result
+    for d in range(n_div):
+        if int(counts[d]) != ref_counts[d]:
+            return False
+        # Numba runs with fastmath, so allow for reordered float additions
+        if not math.isclose(float(sums[d]), ref_sums[d], rel_tol=1e-12, abs_tol=1e-12):
+            return False
+    return True
+
+
+def main():
+    """Check every available _div_stats variant against the pure-Python one."""
+    variants = main_task._div_stats_variants()
+    n_div = len(main_task.Division)
+    print(f"Variants available: {', '.join(variants)}")
+    
+    failures = 0
+    for hub_name, hub in build_hubs().items():
+        reference = main_task._py_div_stats(hub._avg_scores, hub._div_ids, n_div)
+        for name, variant in variants.items():
+            result = variant(hub._avg_scores, hub._div_ids, n_div)
+            if compare(reference, result, n_div):
+                print(f"  {name} on {hub_name}: OK")
+            else:
+                failures += 1
+                print(f"  {name} on {hub_name}: MISMATCH {result} != {reference}")
+    
+    if failures:
+        raise SystemExit(f"{failures} variant check(s) failed.")
+    print("All variants agree.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,69 +2,255 @@
 # This program organizes attachees (interns) into divisions,
 # allows task assignment, feedback collection, and scoring by supervisors.
 
+import os
+import threading
+from array import array
+from enum import IntEnum
+from math import fsum
+from types import MappingProxyType
+
+
+class Division(IntEnum):
+    """The four key divisions in the hub."""
+    ENGINEERING = 0
+    TECH_PROGRAMS = 1
+    RADIO_SUPPORT = 2
+    HUB_SUPPORT = 3
+
+
+# Display names of the divisions, indexed by Division value
+DIVISION_NAMES = ("Engineering", "Tech Programs", "Radio Support", "Hub Support")
+# Maps display names to divisions so the string-based API keeps working
+_NAME_TO_DIV = {name: Division(i) for i, name in enumerate(DIVISION_NAMES)}
+
+
+def _to_division(division):
+    """Resolve a Division or a division display name, or None if invalid."""
+    # Display names are the common case, so they get the single hash probe
+    if isinstance(division, str):
+        return _NAME_TO_DIV.get(division)
+    if isinstance(division, Division):
+        return division
+    return None
+
+
+def _py_div_stats(scores, div_ids, n_div):
+    """Return per-division (sums, counts) of scores grouped by division id."""
+    sums = [0.0] * n_div
+    counts = [0] * n_div
+    for score, d in zip(scores, div_ids):
+        sums[d] += score
+        counts[d] += 1
+    return sums, counts
+
+
+def _div_stats_variants():
+    """Return the _div_stats implementations available here, keyed by name.
+    
+    The pure-Python variant is always present; "numpy" and "numba" are added
+    when those packages can be imported. All variants take the hub's score
+    and division id columns and return the same (sums, counts).
+    """
+    variants = {"python": _py_div_stats}
+    try:
+        import numpy as np
+    except ImportError:
+        return variants
+    
+    def _numpy_div_stats(scores, div_ids, n_div):
+        ids = np.frombuffer(div_ids, dtype=np.int8)
+        sums = np.bincount(ids, weights=np.frombuffer(scores, dtype=np.float64),
+                           minlength=n_div)
+        return sums, np.bincount(ids, minlength=n_div)
+    variants["numpy"] = _numpy_div_stats
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return variants
+    
+    @njit(cache=True, fastmath=True)
+    def _div_stats_kernel(scores, div_ids, sums, counts):
+        # Single compiled pass accumulating into the caller's arrays
+        for i in range(scores.shape[0]):
+            d = div_ids[i]
+            sums[d] += scores[i]
+            counts[d] += 1
+    
+    def _jit_div_stats(scores, div_ids, n_div):
+        sums = np.zeros(n_div, dtype=np.float64)
+        counts = np.zeros(n_div, dtype=np.int64)
+        # Wrap the array buffers without copying before calling the kernel
+        _div_stats_kernel(np.frombuffer(scores, dtype=np.float64),
+                          np.frombuffer(div_ids, dtype=np.int8), sums, counts)
+        return sums, counts
+    variants["numba"] = _jit_div_stats
+    return variants
+
+
+def _make_div_stats():
+    """Choose the _div_stats implementation for this run.
+    
+    Importing NumPy and Numba and compiling the kernel is slow, so the
+    accelerated variants are only used when THUB_JIT=1 is set. The Numba
+    kernel is then compiled into the on-disk cache on a daemon thread, and
+    NumPy alone is used if Numba is missing.
+    """
+    if os.environ.get("THUB_JIT") != "1":
+        return _py_div_stats
+    variants = _div_stats_variants()
+    if "numba" in variants:
+        threading.Thread(target=variants["numba"], daemon=True,
+                         args=(array("d", [0.0]), array("b", [0]), 1)).start()
+        return variants["numba"]
+    return variants.get("numpy", _py_div_stats)
+
+
+_div_stats = _make_div_stats()
+
+
+def _format_task_lines(task, score, feedback):
+    """Render the performance summary lines for a single task."""
+    return (f"  - {task}\n"
+            f"    Score: {score}/10\n"
+            f"    Feedback: {feedback if feedback else 'No feedback yet'}\n")
+
+
 class Attachee:
     """Class representing an intern/attachee at the tech innovation hub."""
     
+    __slots__ = ("_name", "_division", "_tasks", "_by_task",
+                 "average_score", "_score_sum", "_score_count",
+                 "_dirty", "_cached_summary", "_hub", "_hub_index")
+    
     def __init__(self, name, division):
         """Initialize an attachee with a name and division."""
-        self.name = name
-        self.division = division
-        self.tasks = []  # List to store assigned tasks
-        self.feedback = {}  # Dictionary to store feedback for each task
-        self.scores = {}  # Dictionary to store scores for each task
-        self.average_score = 0  # Track average score
+        self._name = name
+        self._division = division
+        self._tasks = []  # List to store assigned tasks
+        self._by_task = {}  # Task -> [score, feedback, summary lines] for each task
+        self.average_score = 0.0  # Track average score
+        self._score_sum = 0  # Running total of task scores
+        self._score_count = 0  # Number of tasks contributing to the average
+        self._dirty = True  # Whether the cached summary needs rebuilding
+        self._cached_summary = None  # Last summary built by get_performance_summary
+        self._hub = None  # TechHub this attachee belongs to, if any
+        self._hub_index = -1  # Position of this attachee in the hub's score column
+    
+    @property
+    def name(self):
+        """The attachee's name; read-only since the hub indexes attachees by it."""
+        return self._name
+    
+    @property
+    def division(self):
+        """The attachee's division name; read-only since summaries are cached."""
+        return self._division
+    
+    @property
+    def tasks(self):
+        """Read-only snapshot of the assigned tasks, in assignment order.
+        
+        Built on every access; use assign_task to add tasks.
+        """
+        return tuple(self._tasks)
+    
+    @property
+    def feedback(self):
+        """Read-only snapshot of the feedback for each task.
+        
+        Built on every access; use add_feedback to change feedback.
+        """
+        return MappingProxyType({task: entry[1] for task, entry in self._by_task.items()})
+    
+    @property
+    def scores(self):
+        """Read-only snapshot of the score for each task.
+        
+        Built on every access; use add_score to change scores.
+        """
+        return MappingProxyType({task: entry[0] for task, entry in self._by_task.items()})
     
     def assign_task(self, task):
         """Assign a task to the attachee."""
-        self.tasks.append(task)
-        self.feedback[task] = ""
-        self.scores[task] = 0
+        self._assign_task_fast(task, _format_task_lines(task, 0, ""))
         return f"Task '{task}' assigned to {self.name} in {self.division} division."
     
+    def _assign_task_fast(self, task, lines):
+        """Assign a task without building a confirmation message.
+        
+        lines is the task's pre-rendered unscored summary, so batch callers
+        can format it once and share it between attachees.
+        """
+        entry = self._by_task.get(task)
+        if entry is None:
+            self._by_task[task] = [0, "", lines]
+            self._score_count += 1
+        else:
+            # Re-assigning a task resets its entry in place
+            self._set_score(entry, 0)
+            entry[1] = ""
+            entry[2] = lines
+        self._tasks.append(task)
+        self._dirty = True
+    
     def add_feedback(self, task, feedback):
         """Add feedback for a specific task."""
-        if task in self.tasks:
-            self.feedback[task] = feedback
+        entry = self._by_task.get(task)
+        if entry is not None:
+            entry[1] = feedback
+            entry[2] = _format_task_lines(task, entry[0], feedback)
+            self._dirty = True
             return f"Feedback added for {self.name}'s task: '{task}'"
         else:
             return f"Error: Task '{task}' not assigned to {self.name}."
     
     def add_score(self, task, score):
         """Add a score for a specific task."""
-        if task in self.tasks:
+        entry = self._by_task.get(task)
+        if entry is not None:
             if 0 <= score <= 10:
-                self.scores[task] = score
-                self._update_average_score()
+                self._set_score(entry, score)
+                entry[2] = _format_task_lines(task, score, entry[1])
+                self.average_score = self._score_sum / self._score_count
+                if self._hub is not None:
+                    self._hub._avg_scores[self._hub_index] = self.average_score
+                self._dirty = True
                 return f"Score of {score}/10 added for {self.name}'s task: '{task}'"
             else:
                 return "Error: Score must be between 0 and 10."
         else:
             return f"Error: Task '{task}' not assigned to {self.name}."
     
-    def _update_average_score(self):
-        """Update the average score based on all task scores."""
-        if self.scores:
-            self.average_score = sum(self.scores.values()) / len(self.scores)
+    def _set_score(self, entry, score):
+        """Set a task entry's score, keeping _score_sum equal to sum() of all scores."""
+        old = entry[0]
+        entry[0] = score
+        if isinstance(self._score_sum, int) and isinstance(old, int) and isinstance(score, int):
+            self._score_sum += score - old
         else:
-            self.average_score = 0
+            # Float deltas drift from a fresh sum, so recompute it exactly
+            self._score_sum = sum(e[0] for e in self._by_task.values())
     
     def get_performance_summary(self):
         """Get a summary of the attachee's performance."""
-        summary = f"\n--- {self.name}'s Performance Summary ({self.division} Division) ---\n"
-        
-        if not self.tasks:
-            summary += "No tasks assigned yet.\n"
-            return summary
+        if not self._dirty and self._cached_summary is not None:
+            return self._cached_summary
         
-        summary += f"Average Score: {self.average_score:.1f}/10\n"
-        summary += "Tasks:\n"
+        parts = [f"\n--- {self.name}'s Performance Summary ({self.division} Division) ---\n"]
         
-        for task in self.tasks:
-            summary += f"  - {task}\n"
-            summary += f"    Score: {self.scores[task]}/10\n"
-            summary += f"    Feedback: {self.feedback[task] if self.feedback[task] else 'No feedback yet'}\n"
+        if not self._tasks:
+            parts.append("No tasks assigned yet.\n")
+        else:
+            parts.append(f"Average Score: {self.average_score:.1f}/10\n")
+            parts.append("Tasks:\n")
+            
+            by_task = self._by_task
+            parts.extend([by_task[task][2] for task in self._tasks])
         
-        return summary
+        self._cached_summary = "".join(parts)
+        self._dirty = False
+        return self._cached_summary
 
 
 class TechHub:
@@ -72,40 +258,67 @@ class TechHub:
     
     def __init__(self):
         """Initialize the Tech Hub with empty divisions."""
-        # The four key divisions in the hub
-        self.divisions = ["Engineering", "Tech Programs", "Radio Support", "Hub Support"]
+        # The four key divisions in the hub (read-only; see Division)
+        self.divisions = DIVISION_NAMES
         self.attachees = []  # List to store all attachees
+        self._by_name = {}  # Case-folded name -> attachee, for O(1) lookup
+        self._by_division = tuple([] for _ in Division)  # Attachees, indexed by Division
+        self._avg_scores = array("d")  # Average score of each attachee, by hub index
+        self._div_ids = array("b")  # Division of each attachee, by hub index
     
     def add_attachee(self, name, division):
         """Add a new attachee to the specified division."""
-        if division in self.divisions:
+        div = _to_division(division)
+        if div is not None:
+            division = DIVISION_NAMES[div]
             attachee = Attachee(name, division)
+            attachee._hub = self
+            attachee._hub_index = len(self.attachees)
             self.attachees.append(attachee)
+            self._avg_scores.append(0.0)
+            self._div_ids.append(div)
+            self._by_division[div].append(attachee)
+            self._by_name.setdefault(name.casefold(), attachee)
             return f"{name} added to {division} division."
         else:
             return f"Error: {division} is not a valid division."
     
     def get_attachee(self, name):
         """Get an attachee by name."""
-        for attachee in self.attachees:
-            if attachee.name.lower() == name.lower():
-                return attachee
-        return None
+        return self._by_name.get(name.casefold())
+    
+    def get_average_score(self):
+        """Get the mean average score across all attachees in the hub."""
+        if self._avg_scores:
+            return fsum(self._avg_scores) / len(self._avg_scores)
+        else:
+            return 0.0
+    
+    def get_division_averages(self):
+        """Get the mean average score of each division, keyed by division name."""
+        sums, counts = _div_stats(self._avg_scores, self._div_ids, len(Division))
+        # Convert at the boundary so every _div_stats variant yields plain floats
+        return {name: (float(sums[d]) / int(counts[d]) if counts[d] else 0.0)
+                for d, name in enumerate(DIVISION_NAMES)}
     
     def get_attachees_by_division(self, division):
         """Get all attachees in a specific division."""
-        if division in self.divisions:
-            return [a for a in self.attachees if a.division == division]
+        div = _to_division(division)
+        if div is not None:
+            return list(self._by_division[div])
         else:
             return []
     
     def assign_task_by_division(self, division, task):
         """Assign a task to all attachees in a division."""
-        if division in self.divisions:
-            attachees = self.get_attachees_by_division(division)
+        div = _to_division(division)
+        if div is not None:
+            division = DIVISION_NAMES[div]
+            attachees = self._by_division[div]
             if attachees:
+                lines = _format_task_lines(task, 0, "")
                 for attachee in attachees:
-                    attachee.assign_task(task)
+                    attachee._assign_task_fast(task, lines)
                 return f"Task '{task}' assigned to all attachees in {division} division."
             else:
                 return f"No attachees found in {division} division."
@@ -114,13 +327,15 @@ class TechHub:
     
     def display_division_performance(self, division):
         """Display performance of all attachees in a division."""
-        if division in self.divisions:
-            attachees = self.get_attachees_by_division(division)
+        div = _to_division(division)
+        if div is not None:
+            division = DIVISION_NAMES[div]
+            attachees = self._by_division[div]
             if attachees:
-                result = f"\n=== {division} Division Performance ===\n"
+                parts = [f"\n=== {division} Division Performance ===\n"]
                 for attachee in attachees:
-                    result += attachee.get_performance_summary()
-                return result
+                    parts.append(attachee.get_performance_summary())
+                return "".join(parts)
             else:
                 return f"No attachees found in {division} division."
         else:
@@ -128,19 +343,18 @@ class TechHub:
     
     def display_all_attachees(self):
         """Display all attachees grouped by division."""
-        result = "\n=== All Attachees by Division ===\n"
+        parts = ["\n=== All Attachees by Division ===\n"]
         
-        for division in self.divisions:
-            result += f"\n{division} Division:\n"
-            attachees = self.get_attachees_by_division(division)
+        for division, attachees in zip(DIVISION_NAMES, self._by_division):
+            parts.append(f"\n{division} Division:\n")
             
             if attachees:
                 for i, attachee in enumerate(attachees, 1):
-                    result += f"  {i}. {attachee.name} - Avg Score: {attachee.average_score:.1f}/10\n"
+                    parts.append(f"  {i}. {attachee.name} - Avg Score: {attachee.average_score:.1f}/10\n")
             else:
-                result += "  No attachees in this division.\n"
+                parts.append("  No attachees in this division.\n")
         
-        return result
+        return "".join(parts)
 
 
 # Example usage of the system
@@ -199,6 +413,9 @@ def main():
     
     # Display all attachees
     print(hub.display_all_attachees())
+    print(f"Hub Average Score: {hub.get_average_score():.1f}/10")
+    for division, average in hub.get_division_averages().items():
+        print(f"{division} Average Score: {average:.1f}/10")
 
 
 # Run the demonstration